@@ -329,6 +329,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
       <Button 
         onClick={startAssessment} 
         disabled={isLoading}
+        data-testid="assessment-start"
         className="px-8 py-3 text-lg"
       >
         {isLoading ? <LoadingSpinner size="sm" message="" className="w-5 h-5 mr-2" /> : null}
@@ -353,7 +354,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
         {/* Progress Bar */}
         <div className="mb-6">
           <div className="flex justify-between items-center mb-2">
-            <span className="text-sm font-medium text-gray-700 dark:text-gray-300">
+            <span className="text-sm font-medium text-gray-700 dark:text-gray-300" data-testid="assessment-task-counter">
               Task {currentTaskIndex + 1} of {tasks.length}
             </span>
             {timeRemaining !== null && (
@@ -414,7 +415,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
           {/* Question/Prompt */}
           <div className="mb-6">
             <div className="bg-white dark:bg-white/10 ring-1 ring-indigo-200 dark:ring-white/25 rounded-lg p-4 shadow-sm">
-              <p className="text-gray-900 dark:text-gray-100 leading-relaxed">
+              <p className="text-gray-900 dark:text-gray-100 leading-relaxed" data-testid="assessment-question">
                 {getQuestionData(currentTask)?.question_text || currentTask.prompt}
               </p>
             </div>
@@ -480,6 +481,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
                         value={option}
                         checked={responses[currentTask.id] === option}
                         onChange={(e) => handleResponseChange(e.target.value)}
+                        data-testid="assessment-option"
                         className="mt-1 text-blue-600 focus:ring-blue-500"
                       />
                       <span className="text-gray-700 dark:text-gray-300">{option}</span>
@@ -500,6 +502,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
                       value="true"
                       checked={responses[currentTask.id] === 'true'}
                       onChange={(e) => handleResponseChange(e.target.value)}
+                      data-testid="assessment-option"
                       className="text-blue-600 focus:ring-blue-500"
                     />
                     <span className="text-gray-700 dark:text-gray-300 font-medium">True</span>
@@ -511,6 +514,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
                       value="false"
                       checked={responses[currentTask.id] === 'false'}
                       onChange={(e) => handleResponseChange(e.target.value)}
+                      data-testid="assessment-option"
                       className="text-blue-600 focus:ring-blue-500"
                     />
                     <span className="text-gray-700 dark:text-gray-300 font-medium">False</span>
@@ -527,6 +531,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
                   value={responses[currentTask.id] || ''}
                   onChange={(e) => handleResponseChange(e.target.value)}
                   placeholder="Type your response here..."
+                  data-testid="assessment-response"
                   className="w-full p-3 border border-gray-300 dark:border-gray-600 dark:bg-gray-700 dark:text-white rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
                   rows={6}
                   required
@@ -555,6 +560,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
                 }
               }}
               disabled={currentTaskIndex === 0 || isLoading}
+              data-testid="assessment-previous"
               className="rounded-lg bg-white ring-1 ring-indigo-200 text-indigo-700 hover:bg-indigo-50 dark:bg-white/10 dark:text-white dark:ring-white/25"
             >
               Previous
@@ -563,6 +569,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
             <Button
               onClick={submitTaskResponse}
               disabled={isLoading || (!responses[currentTask.id] && !audioBlob)}
+              data-testid="assessment-next"
               className="rounded-lg bg-gradient-to-r from-indigo-600 to-fuchsia-600 text-white hover:from-indigo-700 hover:to-fuchsia-700 shadow-md"
             >
               {isLoading ? (
@@ -600,7 +607,7 @@ const Assessment = ({ onComplete, targetLanguage = 'English' }) => {
           <h2 className="text-xl font-semibold mb-4">Overall Results</h2>
           <div className="space-y-4">
             <div className="text-center">
-              <div className="text-4xl font-bold text-blue-600 dark:text-blue-400 mb-2">
+              <div className="text-4xl font-bold text-blue-600 dark:text-blue-400 mb-2" data-testid="assessment-overall-score">
                 {results.overallScore}/100
               </div>
               <div className={`text-2xl font-semibold ${getCEFRColor(results.cefrLevel)}`}>
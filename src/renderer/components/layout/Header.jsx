@@ -315,6 +315,7 @@ const Header = ({ onToggleSidebar }) => {
           <button
             onClick={() => setShowUserMenu(!showUserMenu)}
             className="flex items-center space-x-2 p-2 rounded-lg bg-white/5 ring-1 ring-white/10 text-white hover:bg-white/15 transition-colors"
+            data-testid="header-user-menu"
           >
             <div className="w-8 h-8 bg-gradient-to-br from-primary to-primary/80 rounded-full flex items-center justify-center">
               <User className="w-4 h-4 text-white" />
@@ -176,6 +176,7 @@ const Sidebar = ({ collapsed, onToggle }) => {
             >
               <NavLink
                 to={item.href}
+                data-testid={`nav-link-${item.name.toLowerCase().replace(/\s+/g, '-')}`}
                 className={({ isActive }) => `
                   group relative flex items-center space-x-3 px-3 py-3 rounded-xl text-sm font-medium transition-all duration-200 backdrop-blur-md
                   ${isActive 
@@ -236,6 +237,7 @@ const Sidebar = ({ collapsed, onToggle }) => {
       <div className="p-4 border-t border-border/40">
         <NavLink
           to="/settings"
+          data-testid="nav-link-settings"
           className={({ isActive }) => `
             group relative flex items-center space-x-3 px-3 py-3 rounded-xl text-sm font-medium transition-all duration-200 backdrop-blur-md
             ${isActive 
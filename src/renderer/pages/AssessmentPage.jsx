@@ -233,6 +233,7 @@ const AssessmentPage = () => {
                 
                 <Button 
                   onClick={handleRetakeAssessment}
+                  data-testid="assessment-retake"
                   className="w-full rounded-xl bg-gradient-to-r from-amber-600 to-rose-600 text-white hover:from-amber-700 hover:to-rose-700 shadow-xl font-semibold"
                 >
                   <span className="inline-flex items-center justify-center space-x-2">
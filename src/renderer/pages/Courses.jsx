@@ -314,6 +314,7 @@ const Courses = () => {
         }}
         role={!course.isUnlocked ? undefined : 'button'}
         aria-disabled={!course.isUnlocked}
+        data-testid="course-card"
       >
         {/* Premium glass card styling */}
         <Card className={`relative overflow-hidden h-full transition-all duration-300 ${
@@ -418,6 +419,7 @@ const Courses = () => {
                     variant={course.progress > 0 ? "default" : "outline"}
                     className={`text-xs rounded-full ${isDashboardStyle ? 'bg-white/10 hover:bg-white/20 ring-1 ring-primary/20' : 'bg-white/10 hover:bg-white/20 ring-1 ring-white/15'}`}
                     onClick={() => navigate(`/courses/${course.id}`)}
+                    data-testid="course-card-action"
                   >
                     {course.progress > 0 ? (
                       <>
@@ -78,6 +78,7 @@ const Login = () => {
                 <Mail className="icon" />
                 <input
                   id="email"
+                  data-testid="signin-email"
                   type="email"
                   value={email}
                   onChange={(e) => setEmail(e.target.value)}
@@ -92,6 +93,7 @@ const Login = () => {
                 <Lock className="icon" />
                 <input
                   id="password"
+                  data-testid="signin-password"
                   type={showPassword ? 'text' : 'password'}
                   value={password}
                   onChange={(e) => setPassword(e.target.value)}
@@ -114,7 +116,7 @@ const Login = () => {
                 <Link to="/auth/forgot-password" className="link">Forgot password?</Link>
               </div>
 
-              <button type="submit" className="submit-btn" disabled={isLoading}>
+              <button type="submit" className="submit-btn" data-testid="signin-submit" disabled={isLoading}>
                 {isLoading ? (
                   <>
                     <LoadingSpinner className="w-4 h-4" />
@@ -147,7 +149,7 @@ const Login = () => {
             <div className="footer">
               <span>
                 Don't have an account?{' '}
-                <Link to="/auth/signup" className="link">Sign up</Link>
+                <Link to="/auth/signup" className="link" data-testid="signin-signup-link">Sign up</Link>
               </span>
             </div>
           </div>
@@ -167,6 +167,7 @@ const SignUp = () => {
                 <User className="icon" />
                 <input
                   id="fullName"
+                  data-testid="signup-full-name"
                   name="fullName"
                   type="text"
                   value={formData.fullName}
@@ -182,6 +183,7 @@ const SignUp = () => {
                 <Mail className="icon" />
                 <input
                   id="email"
+                  data-testid="signup-email"
                   name="email"
                   type="email"
                   value={formData.email}
@@ -197,6 +199,7 @@ const SignUp = () => {
                 <Lock className="icon" />
                 <input
                   id="password"
+                  data-testid="signup-password"
                   name="password"
                   type={showPassword ? 'text' : 'password'}
                   value={formData.password}
@@ -220,6 +223,7 @@ const SignUp = () => {
                 <Lock className="icon" />
                 <input
                   id="confirmPassword"
+                  data-testid="signup-confirm-password"
                   name="confirmPassword"
                   type={showConfirmPassword ? 'text' : 'password'}
                   value={formData.confirmPassword}
@@ -245,7 +249,7 @@ const SignUp = () => {
                 </span>
               </div>
 
-              <button type="submit" className="submit-btn" disabled={isLoading}>
+              <button type="submit" className="submit-btn" data-testid="signup-submit" disabled={isLoading}>
                 {isLoading ? (
                   <>
                     <LoadingSpinner className="w-4 h-4" />
@@ -277,7 +281,7 @@ const SignUp = () => {
               <div className="links">
                 <span>
                   Already have an account?{' '}
-                  <Link to="/auth/login" className="link">Sign in</Link>
+                  <Link to="/auth/login" className="link" data-testid="signup-signin-link">Sign in</Link>
                 </span>
               </div>
             </form>
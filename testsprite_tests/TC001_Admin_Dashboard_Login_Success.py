@@ -1,88 +1,36 @@
-import asyncio
-from playwright import async_api
+import re
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://127.0.0.1:3002", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Find and navigate to the admin login page.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to reload the page to see if it resolves the loading issue.
-        await page.goto('http://127.0.0.1:3002/', timeout=10000)
-        
-
-        # Try to navigate directly to a common admin login URL such as http://127.0.0.1:3002/admin or http://127.0.0.1:3002/login to access the admin login page.
-        await page.goto('http://127.0.0.1:3002/admin', timeout=10000)
-        
+from playwright.async_api import expect
 
-        # Enter valid admin username and password, then click the Sign In button.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('bennyb7878@gmail.com')
-        
+from _harness import ADMIN_PASSWORD, ADMIN_USERNAME, block_heavy_resources, open_page
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('HAji.777')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def test_admin_dashboard_login_success(new_context):
+    # Create a new browser context (like an incognito window)
+    context = await new_context()
+    context.set_default_timeout(10_000)
+    
+    await block_heavy_resources(context)
+    
+    # Open a new page in the browser context and navigate to your target URL
+    page = await open_page(context, "/admin")
+    
+    # The dashboard sends signed-out visitors to the admin login page
+    await expect(page).to_have_url(re.compile(r"/admin-login\.html$"))
+    
+    # Interact with the page elements to simulate user flow
+    # Enter valid admin username and password, then click the Sign In button.
+    elem = page.get_by_label("Username")
+    await elem.fill(ADMIN_USERNAME)
+    
 
-        assert False, 'Test failed: Admin login did not succeed as expected.'
-        await asyncio.sleep(5)
+    elem = page.get_by_label("Password", exact=True)
+    await elem.fill(ADMIN_PASSWORD)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
+
+    elem = page.get_by_role("button", name="Sign In")
+    await elem.click()
     
+
+    # Assert that a successful login lands on the admin dashboard
+    await expect(page).to_have_url(re.compile(r"/admin-dashboard\.html$"))
+    await expect(page.get_by_role("heading", name="EdLingo Admin Dashboard")).to_be_visible()
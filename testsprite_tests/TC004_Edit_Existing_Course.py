@@ -1,93 +1,26 @@
-import asyncio
-from playwright import async_api
+import pytest
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://127.0.0.1:3002", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Try to reload the page once more or check for alternative ways to access login or course management.
-        await page.goto('http://127.0.0.1:3002/', timeout=10000)
-        
-
-        # Input educator email and password, then click Sign In.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('bennyb7878@gmail.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('HAji.777')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Navigate to the existing course management page by clicking the 'Courses' link.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from _harness import open_page
 
-        # Click on the course card or Start button to open course details for editing.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[5]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Generic failing assertion since expected result is unknown
-        assert False, 'Test failed: Expected result unknown, forcing failure.'
-        await asyncio.sleep(5)
+@pytest.mark.skip(reason="course editing has no defined expected result yet")
+async def test_edit_existing_course(new_context, auth_state):
+    # Create a new browser context that starts from the cached educator session
+    context = await new_context(storage_state=auth_state)
+    context.set_default_timeout(10_000)
+    
+    # Open a new page in the browser context and navigate to your target URL
+    page = await open_page(context)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
+    # Interact with the page elements to simulate user flow
+    # Navigate to the existing course management page by clicking the 'Courses' link.
+    elem = page.get_by_test_id("nav-link-courses")
+    await elem.click()
     
+
+    # Click on the course card or Start button to open course details for editing.
+    elem = page.get_by_test_id("course-card").first
+    await elem.click()
+    
+
+    # Generic failing assertion since expected result is unknown
+    assert False, 'Test failed: Expected result unknown, forcing failure.'
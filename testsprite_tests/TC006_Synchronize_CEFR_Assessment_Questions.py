@@ -1,130 +1,61 @@
-import asyncio
-from playwright import async_api
+from _harness import wait_for_page_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+async def test_synchronize_cefr_assessment_questions(educator_page):
+    # Start from the app's home page, signed in as the cached educator
+    page = educator_page
+    
+    assessment_link = page.get_by_test_id("nav-link-assessment")
+    
+    # Interact with the page elements to simulate user flow
+    # Click on 'Assessment' link to access language proficiency assessment page where CEFR questions synchronization can be triggered and verified.
+    await assessment_link.click(timeout=10000)
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://127.0.0.1:3002", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Input email and password, then click Sign In button to log in.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('bennyb7878@gmail.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('HAji.777')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Assessment' link to access language proficiency assessment page where CEFR questions synchronization can be triggered and verified.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div[9]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Trigger CEFR question synchronization process by navigating to the appropriate settings or admin page if available.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[3]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # Navigate to the 'Assessment' tab to check for CEFR question synchronization options.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div[9]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Trigger CEFR question synchronization process by navigating to the appropriate settings or admin page if available.
+    elem = page.get_by_test_id("nav-link-settings")
+    await elem.click()
+    
 
-        # Click on 'Retake Assessment' button to trigger CEFR question synchronization process and verify updated question sets.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div/div/div/div[3]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Navigate to the 'Assessment' tab to check for CEFR question synchronization options.
+    await assessment_link.click()
+    
 
-        # Click the 'Start Assessment' button to begin the assessment and verify that CEFR questions are correctly synchronized and displayed.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click on 'Retake Assessment' button to trigger CEFR question synchronization process and verify updated question sets.
+    elem = page.get_by_test_id("assessment-retake")
+    await elem.click()
+    
 
-        # Click the 'Next Task' button by locating it via text or use keyboard navigation to proceed to the next CEFR assessment question.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click the 'Start Assessment' button to begin the assessment and verify that CEFR questions are correctly synchronized and displayed.
+    elem = page.get_by_test_id("assessment-start")
+    await elem.click(timeout=10000)
+    await wait_for_page_ready(page)
+    
 
-        # Select an answer option (True or False) to enable the 'Next Task' button and proceed to the next CEFR assessment question for further verification.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[4]/div/div/label/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click the 'Next Task' button by locating it via text or use keyboard navigation to proceed to the next CEFR assessment question.
+    elem = page.locator("#root")
+    await elem.click()
+    
 
-        # Assertion: Verify that all CEFR questions are synced without duplicates or losses by checking the total number of tasks/questions available.
-        assert 'task_number' in page_content['current_task'], "Current task number info is missing, indicating possible sync issue."
-        task_info = page_content['current_task']['task_number'].split(' of ')
-        assert len(task_info) == 2, "Task number format is incorrect."
-        current_task_num = int(task_info[0])
-        total_tasks = int(task_info[1])
-        assert total_tasks > 0, "No CEFR questions found, sync might have failed."
-        assert current_task_num <= total_tasks, "Current task number exceeds total tasks, indicating sync error.",
-        # Assertion: Validate that assessments referencing CEFR questions display the correct and updated question sets.
-        assert 'sentence_to_assess' in page_content['current_task'], "Assessment question text missing, indicating sync or display issue."
-        assert page_content['current_task']['sentence_to_assess'] != "", "Assessment question text is empty, indicating sync or display issue."
-        assert 'answer_options' in page_content['current_task'], "Answer options missing in assessment, indicating sync or display issue."
-        assert set(page_content['current_task']['answer_options']) == {'True', 'False'}, "Answer options do not match expected True/False options.",
-        await asyncio.sleep(5)
+    # Select an answer option (True or False) to enable the 'Next Task' button and proceed to the next CEFR assessment question for further verification.
+    elem = page.get_by_test_id("assessment-option").first
+    await elem.click()
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
+
+    # Read the current task's counter, question text and answer labels from the page
+    task_number = await page.get_by_test_id("assessment-task-counter").text_content()
+    sentence_to_assess = await page.get_by_test_id("assessment-question").text_content()
+    answer_options = await page.locator("label:has([data-testid=assessment-option])").all_inner_texts()
     
+    # Assertion: Verify that all CEFR questions are synced without duplicates or losses by checking the total number of tasks/questions available.
+    assert task_number, "Current task number info is missing, indicating possible sync issue."
+    task_info = task_number.strip().removeprefix('Task ').split(' of ')
+    assert len(task_info) == 2, "Task number format is incorrect."
+    current_task_num = int(task_info[0])
+    total_tasks = int(task_info[1])
+    assert total_tasks > 0, "No CEFR questions found, sync might have failed."
+    assert current_task_num <= total_tasks, "Current task number exceeds total tasks, indicating sync error."
+    # Assertion: Validate that assessments referencing CEFR questions display the correct and updated question sets.
+    assert sentence_to_assess is not None, "Assessment question text missing, indicating sync or display issue."
+    assert sentence_to_assess.strip() != "", "Assessment question text is empty, indicating sync or display issue."
+    assert answer_options, "Answer options missing in assessment, indicating sync or display issue."
+    assert {option.strip() for option in answer_options} == {'True', 'False'}, "Answer options do not match expected True/False options."
@@ -1,176 +1,93 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://127.0.0.1:3002", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Try to reload the page to resolve the loading issue.
-        await page.goto('http://127.0.0.1:3002/', timeout=10000)
-        
-
-        # Try to reload again or check for alternative ways to access the assessment system.
-        await page.goto('http://127.0.0.1:3002/', timeout=10000)
-        
-
-        # Input email and password, then click Sign In to access the assessment system.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('bennyb7878@gmail.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('HAji.777')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Navigate to the 'Assessment' section to start the CEFR-based language proficiency assessment.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/div[9]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Retake Assessment' button to start a new CEFR-based assessment with predefined answers for validation.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div/div/div/div[3]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Start Assessment' button to begin the CEFR-based assessment.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Select the correct answer 'pen' for the question 'What do you use to write?' and click 'Next Task' to proceed to the next question.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[4]/div/div/label/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Next Task' button to proceed to the next question in the CEFR-based assessment.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Select the correct answer 'True' for the sentence 'I am happy' and click 'Next Task' to proceed to the next question.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[4]/div/div/label/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Select the correct answer 'True' for the sentence 'I am happy' and click 'Next Task' to proceed to the next question.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[4]/div/div/label/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Select the correct answer 'is' (input index 24) and then click the 'Next Task' button to proceed to the next question.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[4]/div/div/label[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the 'Next Task' button to proceed to question 4.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Input a predefined writing response describing a daily routine in 3-4 sentences into the text area and then click the 'Next Task' button to proceed.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[4]/div/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('I wake up early every day. I eat breakfast and go to work. In the evening, I relax and read books.')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div[2]/main/div/div/div[2]/div/div[2]/div[5]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Wait for the assessment results page or score display element to be visible after completing the assessment.
-        score_element = frame.locator('xpath=//div[contains(@class, "score-display")]')
-        await score_element.wait_for(state='visible', timeout=10000)
-        score_text = await score_element.text_content()
-        # Extract the numeric score from the score text, assuming format like 'Score: 85'
-        import re
-        score_match = re.search(r'\d+', score_text)
-        assert score_match is not None, 'Score not found in the score display element'
-        score = int(score_match.group())
-        # Define the expected score based on CEFR scoring rules for the predefined answers
-        # For this example, assume the expected score is 85 (this should be adjusted based on actual scoring rules and answers)
-        expected_score = 85
-        assert score == expected_score, f'Expected score {expected_score}, but got {score}'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
+from playwright.async_api import expect
+
+from _harness import wait_for_page_ready
+
+def is_task_update(response):
+    # Next Task saves the answer through PostgREST before the component moves to the next question
+    return "/rest/v1/assessment_tasks" in response.url and response.request.method == "PATCH"
+
+async def submit_task(page, next_button, next_index=None):
+    # Click Next Task and return once the answer is saved, so the following step sees the next question rather than this one
+    async with page.expect_response(is_task_update, timeout=10000):
+        await next_button.click()
+    # The save lands before the re-render, so also wait for the counter to show the next task before answering it
+    if next_index is not None:
+        await expect(page.get_by_test_id("assessment-task-counter")).to_contain_text(f"Task {next_index} of")
+
+async def test_assessment_scoring_accuracy(educator_page):
+    # Start from the app's home page, signed in as the cached educator
+    page = educator_page
+    
+    next_button = page.get_by_test_id("assessment-next")
+    first_option = page.get_by_test_id("assessment-option").first
     
+    # Interact with the page elements to simulate user flow
+    # Navigate to the 'Assessment' section to start the CEFR-based language proficiency assessment.
+    elem = page.get_by_test_id("nav-link-assessment")
+    await elem.click(timeout=10000)
+    
+
+    # Click the 'Retake Assessment' button to start a new CEFR-based assessment with predefined answers for validation.
+    elem = page.get_by_test_id("assessment-retake")
+    await elem.click()
+    
+
+    # Click the 'Start Assessment' button to begin the CEFR-based assessment.
+    elem = page.get_by_test_id("assessment-start")
+    await elem.click(timeout=10000)
+    await wait_for_page_ready(page)
+    
+
+    # Select the correct answer 'pen' for the question 'What do you use to write?' and click 'Next Task' to proceed to the next question.
+    await first_option.click()
+    
+
+    # Click the 'Next Task' button to proceed to the next question in the CEFR-based assessment.
+    await submit_task(page, next_button, 2)
+    
+
+    # Select the correct answer 'True' for the sentence 'I am happy' and click 'Next Task' to proceed to the next question.
+    await first_option.click()
+    
+
+    elem = page.get_by_test_id("assessment-previous")
+    await elem.click()
+    
+
+    await submit_task(page, next_button, 2)
+    
+
+    # Select the correct answer 'True' for the sentence 'I am happy' and click 'Next Task' to proceed to the next question.
+    await first_option.click()
+    
+
+    await submit_task(page, next_button, 3)
+    
+
+    # Select the correct answer 'is' (input index 24) and then click the 'Next Task' button to proceed to the next question.
+    elem = page.get_by_test_id("assessment-option").nth(1)
+    await elem.click()
+    
+
+    # Click the 'Next Task' button to proceed to question 4.
+    await submit_task(page, next_button, 4)
+    
+
+    # Input a predefined writing response describing a daily routine in 3-4 sentences into the text area and then click the 'Next Task' button to proceed.
+    elem = page.get_by_test_id("assessment-response")
+    await elem.fill('I wake up early every day. I eat breakfast and go to work. In the evening, I relax and read books.')
+    
+
+    await submit_task(page, next_button)
+    
+
+    # Wait for the assessment results page or score display element to be visible after completing the assessment.
+    score_element = page.get_by_test_id("assessment-overall-score")
+    await score_element.wait_for(state='visible', timeout=10000)
+    # Extract the numeric score in the browser from text like '85/100', so only the number crosses the wire
+    score = await score_element.evaluate("el => { const match = el.textContent.match(/\\d+/); return match ? parseInt(match[0], 10) : null; }")
+    assert score is not None, 'Score not found in the score display element'
+    # Define the expected score based on CEFR scoring rules for the predefined answers
+    # For this example, assume the expected score is 85 (this should be adjusted based on actual scoring rules and answers)
+    expected_score = 85
+    assert score == expected_score, f'Expected score {expected_score}, but got {score}'
@@ -1,106 +1,32 @@
-import asyncio
-from playwright import async_api
+from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://127.0.0.1:3002", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Check backend/API service status to verify if they are running and accessible, which might explain frontend loading stall.
-        await page.goto('http://127.0.0.1:3002/api/status', timeout=10000)
-        
-
-        # Return to the main frontend page to verify if the app content loads now that backend is confirmed accessible.
-        await page.goto('http://127.0.0.1:3002', timeout=10000)
-        
-
-        # Fill in login credentials and submit to verify frontend functionality post deployment fix.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('bennyb7878@gmail.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('HAji.777')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from _harness import BASE_URL, sign_in
 
-        # Assert that the backend API status is accessible and returns a successful response
-        response = await page.goto('http://127.0.0.1:3002/api/status', timeout=10000)
-        assert response is not None and response.ok, 'Backend API status endpoint is not accessible or returned an error'
-        # Assert that the frontend main page loads successfully without ERR_EMPTY_RESPONSE error
-        response_main = await page.goto('http://127.0.0.1:3002', timeout=10000)
-        assert response_main is not None and response_main.ok, 'Frontend main page did not load successfully'
-        # Assert that the login form is present and can be interacted with
-        frame = context.pages[-1]
-        email_input = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div/div/input').nth(0)
-        password_input = frame.locator('xpath=html/body/div/div/div/div/div/div/form/div[2]/div/input').nth(0)
-        login_button = frame.locator('xpath=html/body/div/div/div/div/div/div/form/button').nth(0)
-        assert await email_input.is_visible(), 'Email input field is not visible'
-        assert await password_input.is_visible(), 'Password input field is not visible'
-        assert await login_button.is_visible(), 'Login button is not visible'
-        # Assert that the user can fill in the login form and submit without errors
-        await email_input.fill('bennyb7878@gmail.com')
-        await password_input.fill('HAji.777')
-        await login_button.click(timeout=5000)
-        # Optionally, wait for navigation or some indication of successful login
-        await page.wait_for_timeout(3000)
-        # Assert that the app content loads and user data is displayed correctly
-        app_name = await frame.locator('text=EdLingo').first()
-        assert await app_name.is_visible(), 'App name EdLingo is not visible, indicating frontend may not have loaded correctly'
-        await asyncio.sleep(5)
+async def test_netlify_fixes_script_execution(new_context):
+    # Create a new browser context (like an incognito window)
+    context = await new_context()
+    context.set_default_timeout(1500)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
+    # Open a new page in the browser context
+    page = await context.new_page()
     
+    # Navigate to your target URL and wait for the main document to be parsed
+    response_main = await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=10000)
+    
+    # Interact with the page elements to simulate user flow
+    # Check backend/API service status to verify if they are running and accessible, which might explain frontend loading stall.
+    # Request it outside the page so the app stays loaded for the sign-in below
+    status_response = await context.request.get(f"{BASE_URL}/api/status", timeout=10000)
+    
+
+    # Fill in login credentials and submit to verify frontend functionality post deployment fix.
+    await sign_in(page)
+    
+
+    # Assert that the backend API status is accessible and returns a successful response
+    assert status_response.ok, 'Backend API status endpoint is not accessible or returned an error'
+    # Assert that the frontend main page loads successfully without ERR_EMPTY_RESPONSE error
+    assert response_main is not None and response_main.ok, 'Frontend main page did not load successfully'
+    # Assert that the app content loads and user data is displayed correctly
+    app_name = page.locator('text=EdLingo').first
+    await expect(app_name, 'App name EdLingo is not visible, indicating frontend may not have loaded correctly').to_be_visible()
@@ -1,78 +1,29 @@
-import asyncio
-from playwright import async_api
+from _harness import BASE_URL, open_page
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+async def test_refresh_postgrest_cache_via_embedded_script(new_context):
+    # Create a new browser context (like an incognito window)
+    context = await new_context()
+    context.set_default_timeout(1500)
+    
+    # Open a new page in the browser context and navigate to your target URL
+    page = await open_page(context)
+    
+    # Interact with the page elements to simulate user flow
+    # Run the refresh-postgrest-cache.js script to attempt to refresh the backend cache and resolve loading issues.
+    # Fetch the endpoints outside the page so the frontend stays loaded for the content check below
+    script_response = await context.request.get(f"{BASE_URL}/refresh-postgrest-cache.js", timeout=10000)
     
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://127.0.0.1:3002", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Run the refresh-postgrest-cache.js script to attempt to refresh the backend cache and resolve loading issues.
-        await page.goto('http://127.0.0.1:3002/refresh-postgrest-cache.js', timeout=10000)
-        
 
-        # Execute the refresh-postgrest-cache.js script in the appropriate environment and monitor output for errors or success messages.
-        await page.goto('http://127.0.0.1:3002/run-refresh-postgrest-cache', timeout=10000)
-        
+    # Execute the refresh-postgrest-cache.js script in the appropriate environment and monitor output for errors or success messages.
+    refresh_response = await context.request.get(f"{BASE_URL}/run-refresh-postgrest-cache", timeout=10000)
+    
 
-        # Assert that the refresh-postgrest-cache.js script executed without errors by checking the response status
-        response = await page.goto('http://127.0.0.1:3002/refresh-postgrest-cache.js', timeout=10000)
-        assert response.status == 200, 'refresh-postgrest-cache.js script did not execute successfully'
-        
-        # Assert that the backend cache refresh endpoint executed successfully
-        response = await page.goto('http://127.0.0.1:3002/run-refresh-postgrest-cache', timeout=10000)
-        assert response.status == 200, 'Backend cache refresh did not complete successfully'
-        
-        # Verify that the frontend loads correctly and does not show ERR_EMPTY_RESPONSE error by checking page content
-        content = await page.content()
-        assert 'ERR_EMPTY_RESPONSE' not in content, 'Frontend loading error: ERR_EMPTY_RESPONSE found in page content'
-        await asyncio.sleep(5)
+    # Assert that the refresh-postgrest-cache.js script executed without errors by checking the response status
+    assert script_response.status == 200, 'refresh-postgrest-cache.js script did not execute successfully'
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
+    # Assert that the backend cache refresh endpoint executed successfully
+    assert refresh_response.status == 200, 'Backend cache refresh did not complete successfully'
     
+    # Verify that the frontend loads correctly and does not show ERR_EMPTY_RESPONSE error by checking page content
+    content = await page.content()
+    assert 'ERR_EMPTY_RESPONSE' not in content, 'Frontend loading error: ERR_EMPTY_RESPONSE found in page content'
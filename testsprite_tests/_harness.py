@@ -0,0 +1,123 @@
+import re
+
+from playwright.async_api import BrowserContext, Page, Route, TimeoutError
+
+# Vite dev server the suite runs against (see .github/workflows/testsprite-e2e.yml)
+BASE_URL = "http://127.0.0.1:3002"
+
+# Registered educator account used by the sign-in flows and the cached auth state
+EDUCATOR_EMAIL = "bennyb7878@gmail.com"
+EDUCATOR_PASSWORD = "HAji.777"
+
+# Demo admin account accepted by admin-login.html
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "admin123"
+
+# Page size of every test context; tests scroll by its height
+VIEWPORT = {"width": 1280, "height": 720}
+
+# Chromium flags shared by every browser the suite launches
+LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--disable-features=TranslateUI", # Skip the translate bubble on non-English pages
+    "--disable-background-timer-throttling",  # Keep timers running in pages that are not focused
+    "--disable-renderer-backgrounding",       # Keep renderers at full priority when their page is in the background
+    "--disable-gpu",                  # Rasterize in software; CI runners have no GPU to hand work to
+]
+
+# Asset URLs worth intercepting; matching on the URL first keeps Vite's module requests off the Python route handler
+HEAVY_ASSET_URL = re.compile(r"\.(png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf|eot|mp3|mp4|webm|ogg|wav)(\?|$)", re.IGNORECASE)
+HEAVY_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+async def _abort_heavy_resource(route: Route) -> None:
+    # Vite serves `import x from "./x.svg"` as a script from the same URL, so only abort real asset loads
+    if route.request.resource_type in HEAVY_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_heavy_resources(context: BrowserContext) -> None:
+    # Skip images, fonts and media in tests that never look at them
+    await context.route(HEAVY_ASSET_URL, _abort_heavy_resource)
+
+
+# Third-party analytics and error reporting hosts that no test asserts on
+ANALYTICS_URL = re.compile(r"google-analytics|googletagmanager|sentry")
+
+
+async def block_analytics(context: BrowserContext) -> None:
+    # Abort analytics and error reporting requests so they neither slow the page nor report test traffic
+    await context.route(ANALYTICS_URL, lambda route: route.abort())
+
+
+async def open_page(context: BrowserContext, path: str = "/") -> Page:
+    # Open a new page in the context and wait for the app's main document to be parsed
+    page = await context.new_page()
+    await page.goto(f"{BASE_URL}{path}", wait_until="domcontentloaded", timeout=10000)
+    return page
+
+
+async def sign_in(page: Page, email: str = EDUCATOR_EMAIL, password: str = EDUCATOR_PASSWORD) -> None:
+    # Wait once for the form to mount, then fill and submit it back to back
+    email_input = page.get_by_test_id("signin-email")
+    await email_input.wait_for(state="visible", timeout=5000)
+    await email_input.fill(email)
+    await page.get_by_test_id("signin-password").fill(password)
+    await page.get_by_test_id("signin-submit").click()
+
+
+# Sets React-controlled inputs through the native value setter so the app's onChange handlers see the change
+_SUBMIT_SIGN_IN_SCRIPT = """({ email, password }) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [testId, value] of [['signin-email', email], ['signin-password', password]]) {
+        const input = document.querySelector(`[data-testid="${testId}"]`);
+        setValue.call(input, value);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+    }
+    document.querySelector('[data-testid="signin-submit"]').click();
+}"""
+
+
+async def submit_sign_in(page: Page, email: str = EDUCATOR_EMAIL, password: str = EDUCATOR_PASSWORD) -> None:
+    # Fill and submit the sign-in form in a single evaluate; for setup only, tests of the form itself use sign_in()
+    await page.get_by_test_id("signin-email").wait_for(state="visible", timeout=5000)
+    await page.evaluate(_SUBMIT_SIGN_IN_SCRIPT, {"email": email, "password": password})
+
+
+async def missing_texts(page: Page, texts: list[str]) -> list[str]:
+    # Check all expected strings against the rendered text in one round trip and return the ones not shown
+    return await page.evaluate(
+        "(texts) => { const body = document.body.innerText; return texts.filter((text) => !body.includes(text)); }",
+        texts,
+    )
+
+
+async def wait_for_page_ready(page: Page, timeout: float = 10000, interval: float = 100) -> None:
+    # Wait for the document to finish loading, then give requests started by the last action a moment to settle
+    await page.wait_for_function("document.readyState === 'complete'", polling=interval, timeout=timeout)
+    try:
+        await page.wait_for_load_state("networkidle", timeout=2000)
+    except TimeoutError:
+        # Supabase and analytics may keep polling; a busy network is not a reason to fail the test
+        pass
+
+
+# Reads the layout facts the responsive checks assert on, after the next frame has been laid out at the current size
+_LAYOUT_SCRIPT = """(texts) => new Promise((resolve) => requestAnimationFrame(() => {
+    const root = document.documentElement;
+    const body = document.body.innerText;
+    resolve({
+        nav_visible: [...document.querySelectorAll('nav')].some((n) => n.checkVisibility()),
+        scroll_width: root.scrollWidth,
+        client_width: root.clientWidth,
+        missing_texts: texts.filter((text) => !body.includes(text)),
+    });
+}))"""
+
+
+async def resize_and_measure(page: Page, width: int, height: int, texts: tuple[str, ...] = ()) -> dict:
+    # Resize the viewport, then read nav visibility, document widths and missing texts in a single round trip
+    await page.set_viewport_size({"width": width, "height": height})
+    return await page.evaluate(_LAYOUT_SCRIPT, list(texts))
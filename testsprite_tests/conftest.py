@@ -0,0 +1,124 @@
+import time
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from playwright import async_api
+from pytest_asyncio import is_async_test
+
+from _harness import LAUNCH_ARGS, VIEWPORT, block_analytics, block_heavy_resources, open_page, submit_sign_in
+
+# Cookies and localStorage of a signed-in educator, reused by tests that start past the login screen
+AUTH_DIR = Path(__file__).parent / ".auth"
+
+# Reuse a saved session across runs while it is younger than this; Supabase access tokens last an hour by default
+AUTH_MAX_AGE = 30 * 60
+
+# Playwright traces written by the new_context fixture when --tracing asks for them
+TRACES_DIR = Path(__file__).parent / "test-results"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tracing",
+        default="off",
+        choices=["on", "off", "retain-on-failure"],
+        help="Record a Playwright trace for each test context (default: off).",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item):
+    # Keep each phase's report on the test item so fixtures can tell whether the test failed
+    report = yield
+    setattr(item, f"rep_{report.when}", report)
+    return report
+
+
+def pytest_collection_modifyitems(items):
+    # Run every async test on the session-wide event loop so it can share the browser below
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def playwright():
+    # One Playwright driver process per worker, shared by every browser launched in it
+    pw = await async_api.async_playwright().start()
+    yield pw
+    await pw.stop()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser(playwright):
+    # Launch Chromium once per worker; each test opens its own context
+    browser = await playwright.chromium.launch(
+        headless=True,
+        channel="chromium",                   # Full Chromium in new headless mode instead of chrome-headless-shell
+        args=LAUNCH_ARGS,
+    )
+    yield browser
+    await browser.close()
+
+
+@pytest_asyncio.fixture
+async def new_context(browser, request):
+    # Factory for browser contexts that are traced according to --tracing and closed after the test
+    tracing = request.config.getoption("--tracing")
+    contexts = []
+
+    async def factory(**kwargs):
+        context = await browser.new_context(**{"viewport": VIEWPORT, **kwargs})
+        if tracing != "off":
+            await context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        contexts.append(context)
+        return context
+
+    yield factory
+
+    report = getattr(request.node, "rep_call", None)
+    failed = report is None or report.failed
+    for index, context in enumerate(contexts):
+        if tracing == "on" or (tracing == "retain-on-failure" and failed):
+            await context.tracing.stop(path=TRACES_DIR / f"{request.node.name}-{index}.zip")
+        elif tracing != "off":
+            await context.tracing.stop()
+        await context.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def auth_state(browser, worker_id):
+    # Sign in once per worker and save the session so other tests can skip the login form
+    path = AUTH_DIR / f"educator-{worker_id}.json"
+    if path.exists() and time.time() - path.stat().st_mtime < AUTH_MAX_AGE:
+        return str(path)
+
+    context = await browser.new_context()
+    context.set_default_timeout(10_000)
+
+    try:
+        page = await open_page(context)
+        await submit_sign_in(page)
+
+        # The sign-in form unmounts once Supabase has stored the session
+        await page.get_by_test_id("signin-submit").wait_for(state="detached")
+
+        AUTH_DIR.mkdir(exist_ok=True)
+        await context.storage_state(path=path)
+    finally:
+        await context.close()
+
+    return str(path)
+
+
+@pytest_asyncio.fixture
+async def educator_page(new_context, auth_state):
+    # The app's home page, signed in as the cached educator, with images, fonts, media and analytics blocked
+    context = await new_context(storage_state=auth_state)
+    context.set_default_timeout(3000)
+    context.set_default_navigation_timeout(10_000)
+    await block_heavy_resources(context)
+    await block_analytics(context)
+    return await open_page(context)
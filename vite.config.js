@@ -201,6 +201,10 @@ export default defineConfig({
     fs: {
       strict: false, // Allow serving files outside of root
       allow: ['..'] // Allow access to parent directories
+    },
+    // Transform the renderer entry and its static imports at startup so the first page load doesn't wait on them
+    warmup: {
+      clientFiles: ['./src/renderer/main.jsx']
     }
   },
   resolve: {